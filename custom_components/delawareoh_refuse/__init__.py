@@ -7,10 +7,20 @@ from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_UPDATE_INTERVAL, DEFAULT_SCAN_INTERVAL
-from .coordinator import DelawareRefuseCoordinator
+from .const import (
+    DOMAIN,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    HOLIDAY_CACHE_KEY,
+    HOLIDAY_CACHE_VERSION,
+)
+from .arcgis_client import async_get_arcgis_client
+from .coordinator import DelawareRefuseCoordinator, HolidayCoordinator
+from .holiday_parser import HolidayParser
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,7 +29,21 @@ PLATFORMS: list[Platform] = [Platform.CALENDAR]
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Delaware Refuse Schedule component."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    # Shared by every config entry
+    async_get_arcgis_client(hass)
+    holiday_coordinator = HolidayCoordinator(
+        hass,
+        HolidayParser(hass, async_get_clientsession(hass)),
+        Store(hass, HOLIDAY_CACHE_VERSION, HOLIDAY_CACHE_KEY),
+    )
+    domain_data["holiday_coordinator"] = holiday_coordinator
+
+    # Calendars work without holiday adjustments if this fails; the
+    # coordinator retries on its next scheduled refresh
+    await holiday_coordinator.async_refresh()
+
     return True
 
 
@@ -58,5 +82,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -1,26 +1,84 @@
 """ArcGIS client for Delaware County address lookup."""
 from __future__ import annotations
 
+import asyncio
+from email.utils import parsedate_to_datetime
 import logging
+import re
+import time
 from typing import Any
 
-import requests
+import aiohttp
 
-from .const import ARCGIS_GEOCODE_URL, ARCGIS_REFUSE_LAYER_URL, ARCGIS_DAY_FIELD
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    ARCGIS_GEOCODE_URL,
+    ARCGIS_REFUSE_LAYER_URL,
+    ARCGIS_DAY_FIELD,
+    GEOCODE_CACHE_KEY,
+    GEOCODE_CACHE_TTL,
+    GEOCODE_CACHE_VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Retry transient ArcGIS failures with exponential backoff
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 1.0  # seconds, doubled after each attempt
+RETRY_MAX_WAIT = 60.0  # seconds, upper bound for server-provided Retry-After
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: str | None, default: float) -> float:
+    """Return the wait in seconds requested by a Retry-After header."""
+    if not value:
+        return default
+
+    try:
+        wait = float(value)
+    except ValueError:
+        # Retry-After may also be an HTTP date
+        try:
+            wait = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default
+
+    return min(max(wait, 0.0), RETRY_MAX_WAIT)
+
+
+@callback
+def async_get_arcgis_client(hass: HomeAssistant) -> ArcGISClient:
+    """Return the ArcGIS client shared by config entries and flows."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (client := domain_data.get("arcgis_client")) is None:
+        client = domain_data["arcgis_client"] = ArcGISClient(
+            async_get_clientsession(hass),
+            Store(hass, GEOCODE_CACHE_VERSION, GEOCODE_CACHE_KEY),
+        )
+    return client
+
 
 class ArcGISClient:
     """Client for interacting with Delaware County ArcGIS service."""
 
-    def __init__(self):
+    def __init__(
+        self, session: aiohttp.ClientSession, store: Store | None = None
+    ):
         """Initialize the ArcGIS client."""
+        self.session = session
+        self.store = store
+        self._cache: dict[str, Any] | None = None
         self.geocode_url = ARCGIS_GEOCODE_URL
         self.refuse_layer_url = ARCGIS_REFUSE_LAYER_URL
         self.day_field = ARCGIS_DAY_FIELD
 
-    def lookup_address(self, address: str) -> dict[str, Any]:
+    async def lookup_address(self, address: str) -> dict[str, Any]:
         """
         Look up an address and return collection information.
 
@@ -32,8 +90,29 @@ class ArcGISClient:
 
         Raises:
             ValueError: If address cannot be found or is invalid
-            requests.RequestException: If API request fails
+            aiohttp.ClientError: If API request fails
         """
+        if self.store is None:
+            return await self._fetch_address(address)
+
+        # Serve repeat lookups of the same address from the on-disk cache
+        key = re.sub(r'\s+', ' ', address.strip().lower())
+        if self._cache is None:
+            self._cache = await self.store.async_load() or {}
+
+        cached = self._cache.get(key)
+        if cached and time.time() - cached.get("cached_at", 0) < GEOCODE_CACHE_TTL:
+            _LOGGER.debug("Using cached lookup for address: %s", address)
+            return {**cached["result"], "address": address}
+
+        result = await self._fetch_address(address)
+        self._cache[key] = {"result": result, "cached_at": time.time()}
+        await self.store.async_save(self._cache)
+
+        return result
+
+    async def _fetch_address(self, address: str) -> dict[str, Any]:
+        """Query the ArcGIS services for an address's collection information."""
         _LOGGER.debug("Looking up address: %s", address)
 
         # Step 1: Geocode the address to get coordinates
@@ -42,15 +121,14 @@ class ArcGISClient:
             "address": address,
             "city": "Delaware",
             "state": "OH",
-            "outFields": "*"
+            # Only the best match's location is used; request it directly in
+            # WGS84 so it can be passed to the refuse layer query as-is
+            "maxLocations": 1,
+            "outSR": "4326",
         }
 
         _LOGGER.debug("Geocoding address with params: %s", geocode_params)
-        geocode_response = requests.get(
-            self.geocode_url, params=geocode_params, timeout=30
-        )
-        geocode_response.raise_for_status()
-        geocode_data = geocode_response.json()
+        geocode_data = await self._get_json(self.geocode_url, geocode_params)
 
         if not geocode_data.get("candidates"):
             raise ValueError(f"Address not found: {address}")
@@ -66,14 +144,12 @@ class ArcGISClient:
             "geometryType": "esriGeometryPoint",
             "inSR": "4326",  # WGS84
             "spatialRel": "esriSpatialRelIntersects",
-            "outFields": "*",
+            "outFields": f"{self.day_field},OBJECTID",
             "returnGeometry": "false"
         }
 
         _LOGGER.debug("Querying refuse layer: %s", query_url)
-        feature_response = requests.get(query_url, params=query_params, timeout=30)
-        feature_response.raise_for_status()
-        feature_data = feature_response.json()
+        feature_data = await self._get_json(query_url, query_params)
 
         if not feature_data.get("features"):
             raise ValueError(f"No collection zone found for address: {address}")
@@ -97,7 +173,47 @@ class ArcGISClient:
             "coordinates": location
         }
 
-    def get_collection_day(self, address: str) -> str:
+    async def _get_json(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Issue a GET request and decode the JSON response.
+
+        Rate limiting (429), server errors and connection failures are retried
+        with exponential backoff, honoring any Retry-After header.
+        """
+        delay = RETRY_BACKOFF
+
+        for _ in range(RETRY_ATTEMPTS - 1):
+            try:
+                async with self.session.get(
+                    url, params=params, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    if response.status not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+
+                    reason = f"HTTP {response.status}"
+                    wait = _parse_retry_after(
+                        response.headers.get("Retry-After"), delay
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                reason = str(err) or type(err).__name__
+                wait = delay
+
+            _LOGGER.debug(
+                "Request to %s failed (%s), retrying in %.1f seconds",
+                url, reason, wait
+            )
+            await asyncio.sleep(wait)
+            delay *= 2
+
+        # Final attempt, errors propagate to the caller
+        async with self.session.get(
+            url, params=params, timeout=REQUEST_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def get_collection_day(self, address: str) -> str:
         """
         Get the collection day for an address.
 
@@ -107,5 +223,5 @@ class ArcGISClient:
         Returns:
             Day of week (e.g., "Monday", "Tuesday")
         """
-        result = self.lookup_address(address)
+        result = await self.lookup_address(address)
         return result.get("collection_day", "Unknown")
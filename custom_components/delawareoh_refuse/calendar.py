@@ -1,16 +1,16 @@
 """Calendar platform for Delaware Refuse Schedule."""
 from __future__ import annotations
 
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta, tzinfo
 import logging
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import DOMAIN, CALENDAR_NAME
 from .coordinator import DelawareRefuseCoordinator
@@ -29,6 +29,29 @@ async def async_setup_entry(
     async_add_entities([DelawareRefuseCalendar(coordinator, entry)], True)
 
 
+def _to_calendar_bounds(
+    start: date, end: date, all_day: bool, local_tz: tzinfo
+) -> tuple[date, date]:
+    """Return event bounds in the form CalendarEvent expects.
+
+    All-day events are generated with date objects and are passed through
+    unchanged; timed events need timezone-aware datetime objects.
+    """
+    if all_day:
+        return start, end
+
+    return _to_local_datetime(start, local_tz), _to_local_datetime(end, local_tz)
+
+
+def _to_local_datetime(value: date, local_tz: tzinfo) -> datetime:
+    """Convert a date or naive datetime to a timezone-aware datetime."""
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time.min, tzinfo=local_tz)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=local_tz)
+    return value
+
+
 class DelawareRefuseCalendar(CoordinatorEntity, CalendarEntity):
     """Representation of a Delaware Refuse Schedule calendar."""
 
@@ -45,12 +68,8 @@ class DelawareRefuseCalendar(CoordinatorEntity, CalendarEntity):
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}"
 
         # Set suggested entity_id based on address (sanitized)
-        # Remove special characters and convert to lowercase with underscores
-        safe_address = address.lower().replace(',', '').replace('.', '')
-        safe_address = ''.join(c if c.isalnum() or c.isspace() else '_' for c in safe_address)
-        safe_address = '_'.join(safe_address.split())
         self._attr_has_entity_name = False
-        self.entity_id = f"calendar.delawareoh_refuse_{safe_address}"
+        self.entity_id = f"calendar.{DOMAIN}_{slugify(address)}"
 
         self._event: CalendarEvent | None = None
 
@@ -62,50 +81,35 @@ class DelawareRefuseCalendar(CoordinatorEntity, CalendarEntity):
     async def async_update(self) -> None:
         """Update the calendar."""
         await super().async_update()
+        self._update_next_event()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the next event before writing the new state."""
+        self._update_next_event()
+        super()._handle_coordinator_update()
 
-        # Find the next upcoming event
+    def _update_next_event(self) -> None:
+        """Find the next upcoming event."""
         now = dt_util.now()
         upcoming_events = self.coordinator.get_events(
             now, now + timedelta(days=30)
         )
 
         if upcoming_events:
-            # Sort by start date and get the first one
-            upcoming_events.sort(key=lambda x: x["start"])
+            # Events are returned in chronological order
             next_event = upcoming_events[0]
 
-            # For all-day events, keep as date objects
-            # For timed events, convert to datetime
-            start = next_event["start"]
-            end = next_event["end"]
-            is_all_day = next_event.get("all_day", False)
-
-            # All-day events should be date objects, not datetime
-            if is_all_day:
-                # Ensure we have date objects
-                if isinstance(start, datetime):
-                    start = start.date()
-                if isinstance(end, datetime):
-                    end = end.date()
-            else:
-                # Timed events need timezone-aware datetime objects
-                if isinstance(start, date) and not isinstance(start, datetime):
-                    start = datetime.combine(start, datetime.min.time())
-                    start = dt_util.as_local(start)
-                elif isinstance(start, datetime) and start.tzinfo is None:
-                    start = dt_util.as_local(start)
-
-                if isinstance(end, date) and not isinstance(end, datetime):
-                    end = datetime.combine(end, datetime.min.time())
-                    end = dt_util.as_local(end)
-                elif isinstance(end, datetime) and end.tzinfo is None:
-                    end = dt_util.as_local(end)
+            start, end = _to_calendar_bounds(
+                next_event.start, next_event.end, next_event.all_day,
+                dt_util.DEFAULT_TIME_ZONE,
+            )
 
             self._event = CalendarEvent(
-                summary=next_event["summary"],
+                summary=next_event.summary,
                 start=start,
                 end=end,
-                description=next_event.get("description", ""),
+                description=next_event.description,
             )
         else:
             self._event = None
@@ -118,37 +122,16 @@ class DelawareRefuseCalendar(CoordinatorEntity, CalendarEntity):
 
         calendar_events = []
         for event in events:
-            start = event["start"]
-            end = event["end"]
-            is_all_day = event.get("all_day", False)
-
-            # All-day events should be date objects, not datetime
-            if is_all_day:
-                # Ensure we have date objects
-                if isinstance(start, datetime):
-                    start = start.date()
-                if isinstance(end, datetime):
-                    end = end.date()
-            else:
-                # Timed events need timezone-aware datetime objects
-                if isinstance(start, date) and not isinstance(start, datetime):
-                    start = datetime.combine(start, datetime.min.time())
-                    start = dt_util.as_local(start)
-                elif isinstance(start, datetime) and start.tzinfo is None:
-                    start = dt_util.as_local(start)
-
-                if isinstance(end, date) and not isinstance(end, datetime):
-                    end = datetime.combine(end, datetime.min.time())
-                    end = dt_util.as_local(end)
-                elif isinstance(end, datetime) and end.tzinfo is None:
-                    end = dt_util.as_local(end)
+            start, end = _to_calendar_bounds(
+                event.start, event.end, event.all_day, dt_util.DEFAULT_TIME_ZONE
+            )
 
             calendar_events.append(
                 CalendarEvent(
-                    summary=event["summary"],
+                    summary=event.summary,
                     start=start,
                     end=end,
-                    description=event.get("description", ""),
+                    description=event.description,
                 )
             )
 
@@ -12,7 +12,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN, CONF_ADDRESS, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-from .arcgis_client import ArcGISClient
+from .arcgis_client import async_get_arcgis_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,13 +31,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    client = ArcGISClient()
+    # Share the session and lookup cache with the config entries, so
+    # re-adding a known address needs no HTTP requests
+    client = async_get_arcgis_client(hass)
 
     try:
         # Validate that we can look up the address
-        result = await hass.async_add_executor_job(
-            client.lookup_address, data[CONF_ADDRESS]
-        )
+        result = await client.lookup_address(data[CONF_ADDRESS])
 
         if not result or "collection_day" not in result:
             raise CannotConnect("Unable to determine collection day for this address")
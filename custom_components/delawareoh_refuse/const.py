@@ -14,8 +14,16 @@ ARCGIS_GEOCODE_URL = "https://geocode.arcgis.com/arcgis/rest/services/World/Geoc
 ARCGIS_REFUSE_LAYER_URL = "https://services.arcgis.com/eDETAHfuRDcwL2kQ/arcgis/rest/services/RefuseDay/FeatureServer/0"
 ARCGIS_DAY_FIELD = "Day"
 
+# Geocode cache (address -> collection zone rarely changes)
+GEOCODE_CACHE_KEY = f"{DOMAIN}_geocode_cache"
+GEOCODE_CACHE_VERSION = 1
+GEOCODE_CACHE_TTL = 365 * 24 * 3600  # seconds (1 year)
+
 # Holiday Information
 HOLIDAY_DOCUMENT_URL = "https://www.delawareohio.net/home/showpublisheddocument/4148/638689880014270000"
+HOLIDAY_CACHE_KEY = f"{DOMAIN}_holidays"
+HOLIDAY_CACHE_VERSION = 1
+HOLIDAY_REFRESH_INTERVAL = 24 * 3600  # seconds (1 day)
 
 # Calendar Configuration
 CALENDAR_NAME = "Delaware OH Refuse Schedule"
@@ -32,3 +40,13 @@ WEEKDAYS = {
     5: "Saturday",
     6: "Sunday"
 }
+
+# Day name -> weekday number
+DAY_TO_IDX = {name: idx for idx, name in WEEKDAYS.items()}
+
+# Days forward from one weekday to the next occurrence of another (same day = 7)
+DAY_OFFSET = {
+    (from_day, to_day): ((DAY_TO_IDX[to_day] - DAY_TO_IDX[from_day]) % 7) or 7
+    for from_day in DAY_TO_IDX
+    for to_day in DAY_TO_IDX
+}
@@ -1,22 +1,93 @@
 """Data update coordinator for Delaware Refuse Schedule."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, CONF_ADDRESS
+from .const import (
+    DOMAIN,
+    CONF_ADDRESS,
+    DAY_TO_IDX,
+    DAY_OFFSET,
+    HOLIDAY_REFRESH_INTERVAL,
+)
 from .arcgis_client import ArcGISClient
 from .holiday_parser import HolidayParser
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class RefuseEvent:
+    """A single refuse collection event."""
+
+    start: date
+    end: date
+    summary: str
+    description: str
+    all_day: bool = True
+
+
+class HolidayCoordinator(DataUpdateCoordinator):
+    """Coordinator to keep the shared holiday schedule up to date."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        parser: HolidayParser,
+        store: Store,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_holidays",
+            update_interval=timedelta(seconds=HOLIDAY_REFRESH_INTERVAL),
+        )
+        self.parser = parser
+        self._store = store
+
+    async def _async_update_data(self) -> dict[date, dict[str, Any]]:
+        """Refresh the holiday schedule unless the last fetch is recent."""
+        parser = self.parser
+
+        try:
+            # Restore the schedule saved before the last restart, and keep it
+            # if it is recent; otherwise the update interval decides
+            if not parser.last_update_ts:
+                if stored := await self._store.async_load():
+                    parser.load_storage(stored)
+                    if time.time() - parser.last_update_ts < HOLIDAY_REFRESH_INTERVAL:
+                        _LOGGER.debug(
+                            "Restored holiday schedule is recent, skipping download"
+                        )
+                        return parser.holidays
+
+            _LOGGER.debug("Updating holiday schedule")
+            last_update_ts = parser.last_update_ts
+            await parser.update()
+
+            if parser.last_update_ts != last_update_ts:
+                await self._store.async_save(parser.to_storage())
+                _LOGGER.debug("Holiday schedule updated successfully")
+
+        except Exception as err:
+            _LOGGER.error("Error updating holiday schedule: %s", err, exc_info=True)
+            raise UpdateFailed(f"Error updating holiday schedule: {err}") from err
+
+        return parser.holidays
+
+
 class DelawareRefuseCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Delaware refuse schedule data."""
 
@@ -35,117 +106,179 @@ class DelawareRefuseCoordinator(DataUpdateCoordinator):
         )
         self.entry = entry
         self.address = entry.data[CONF_ADDRESS]
-        self.arcgis_client = ArcGISClient()
-        self.holiday_parser = HolidayParser()
+
+        # Clients are shared by all entries so the holiday schedule is only
+        # downloaded once no matter how many addresses are configured
+        domain_data = hass.data[DOMAIN]
+        self.arcgis_client: ArcGISClient = domain_data["arcgis_client"]
+        holiday_coordinator: HolidayCoordinator = domain_data["holiday_coordinator"]
+        self.holiday_parser: HolidayParser = holiday_coordinator.parser
         self.collection_day: str | None = None
+        self._adjustment_cache: dict[date, date | None] = {}
+        self._refresh_lock = asyncio.Lock()
+
+        # Listening also keeps the holiday coordinator's daily refresh scheduled
+        entry.async_on_unload(
+            holiday_coordinator.async_add_listener(self._handle_holiday_update)
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the ArcGIS service and holiday schedule."""
-        try:
-            # Get collection day for the address if we don't have it
-            if not self.collection_day:
-                _LOGGER.debug("Looking up collection day for address: %s", self.address)
-                result = await self.hass.async_add_executor_job(
-                    self.arcgis_client.lookup_address, self.address
-                )
-                self.collection_day = result.get("collection_day")
-                _LOGGER.info("Collection day for %s: %s", self.address, self.collection_day)
-
-            # Update holiday schedule (don't fail if this doesn't work)
+        # Overlapping refresh requests wait for the one in progress rather
+        # than repeating the same lookups
+        async with self._refresh_lock:
             try:
-                _LOGGER.debug("Updating holiday schedule")
-                await self.hass.async_add_executor_job(self.holiday_parser.update)
-                _LOGGER.debug("Holiday schedule updated successfully")
-            except Exception as holiday_err:
-                _LOGGER.warning(
-                    "Could not update holiday schedule: %s. "
-                    "Collection calendar will work without holiday adjustments.",
-                    holiday_err
-                )
-
-            # Generate upcoming collection events
-            events = self._generate_events()
-            _LOGGER.debug("Generated %d collection events", len(events))
-
-            return {
-                "collection_day": self.collection_day,
-                "address": self.address,
-                "events": events,
-                "last_updated": datetime.now(),
-            }
-
-        except Exception as err:
-            _LOGGER.error("Error updating Delaware refuse schedule: %s", err, exc_info=True)
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
-
-    def _generate_events(self, days_ahead: int = 90) -> list[dict[str, Any]]:
+                # Get collection day for the address if we don't have it
+                if not self.collection_day:
+                    _LOGGER.debug("Looking up collection day for address: %s", self.address)
+                    result = await self.arcgis_client.lookup_address(self.address)
+                    self.collection_day = result.get("collection_day")
+                    self._adjustment_cache.clear()
+                    _LOGGER.info("Collection day for %s: %s", self.address, self.collection_day)
+
+                # Events are generated on demand for each requested range
+                return {
+                    "collection_day": self.collection_day,
+                    "address": self.address,
+                    "last_updated": dt_util.utcnow(),
+                }
+
+            except Exception as err:
+                _LOGGER.error("Error updating Delaware refuse schedule: %s", err, exc_info=True)
+                raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    @callback
+    def _handle_holiday_update(self) -> None:
+        """Drop adjustments computed against the previous holiday schedule."""
+        self._adjustment_cache.clear()
+        self.async_update_listeners()
+
+    def _generate_events_in_range(
+        self, start: date, end: date
+    ) -> list[RefuseEvent]:
         """
-        Generate collection events for the next N days.
+        Generate collection events falling between two dates.
 
         Args:
-            days_ahead: Number of days to generate events for
+            start: First date to include
+            end: Last date to include
 
         Returns:
-            List of event dictionaries
+            List of events in chronological order
         """
         if not self.collection_day:
             return []
 
         events = []
-        today = date.today()
-
-        # Map day names to weekday numbers
-        day_mapping = {
-            "Monday": 0,
-            "Tuesday": 1,
-            "Wednesday": 2,
-            "Thursday": 3,
-            "Friday": 4,
-            "Saturday": 5,
-            "Sunday": 6,
-        }
-
-        target_weekday = day_mapping.get(self.collection_day)
+
+        target_weekday = DAY_TO_IDX.get(self.collection_day)
         if target_weekday is None:
             _LOGGER.error("Invalid collection day: %s", self.collection_day)
             return []
 
-        # Find all occurrences of the collection day in the next N days
-        current_date = today
-        end_date = today + timedelta(days=days_ahead)
+        # All events are "Trash & Recycling Collection"
+        summary = "Trash & Recycling Collection"
+        description = f"Trash and recycling collection for {self.address}"
 
-        while current_date <= end_date:
-            if current_date.weekday() == target_weekday:
-                # Check if this date needs to be adjusted for a holiday
-                # Need to check the entire week for holidays that might affect this day
-                adjusted_date = self._get_adjusted_collection_date(current_date)
+        # Holiday adjustments only move collections forward, so start a week
+        # early to pick up collections pushed into the range
+        first_date = start - timedelta(days=7)
+        current_date = first_date + timedelta(
+            days=(target_weekday - first_date.weekday()) % 7
+        )
+        week_adjustments = self._compute_week_adjustments(
+            first_date, end, target_weekday
+        )
 
-                if adjusted_date is None:
-                    # No collection this day (cancelled)
-                    current_date += timedelta(days=1)
-                    continue
+        while current_date <= end:
+            # Weeks without a holiday keep their regular collection day
+            delta = week_adjustments.get(current_date.isocalendar()[:2], 0)
 
-                # All events are "Trash & Recycling Collection"
-                summary = "Trash & Recycling Collection"
-                description = f"Trash and recycling collection for {self.address}"
+            if delta is not None:
+                adjusted_date = current_date + timedelta(days=delta)
 
-                events.append({
-                    "summary": summary,
-                    "start": adjusted_date,
-                    "end": adjusted_date,
-                    "description": description,
-                    "all_day": True,
-                })
+                if start <= adjusted_date <= end:
+                    events.append(RefuseEvent(
+                        start=adjusted_date,
+                        end=adjusted_date,
+                        summary=summary,
+                        description=description,
+                    ))
 
-            current_date += timedelta(days=1)
+            current_date += timedelta(days=7)
 
+        # Callers rely on chronological order; holiday adjustments move a
+        # collection by less than a week, so weekly stepping preserves it
         _LOGGER.debug("Generated %d collection events", len(events))
         return events
 
+    def _compute_week_adjustments(
+        self, start: date, end: date, target_weekday: int
+    ) -> dict[tuple[int, int], int | None]:
+        """
+        Compute how holidays shift collection in each affected week.
+
+        Args:
+            start: First scheduled collection date to consider
+            end: Last scheduled collection date to consider
+            target_weekday: Weekday number of the regular collection day
+
+        Returns:
+            Mapping of ISO (year, week) to the number of days collection moves,
+            or None if collection is cancelled that week
+        """
+        adjustments: dict[tuple[int, int], int | None] = {}
+        # A holiday earlier in the week can still affect a date in range
+        week_start = start - timedelta(days=start.weekday())
+
+        for holiday_date in self.holiday_parser.holidays:
+            if not week_start <= holiday_date <= end:
+                continue
+
+            week = holiday_date.isocalendar()[:2]
+            if week in adjustments:
+                continue
+
+            scheduled_date = holiday_date + timedelta(
+                days=target_weekday - holiday_date.weekday()
+            )
+            adjusted_date = self._get_adjusted_collection_date(scheduled_date)
+            adjustments[week] = (
+                None if adjusted_date is None
+                else (adjusted_date - scheduled_date).days
+            )
+
+        return adjustments
+
     def _get_adjusted_collection_date(self, scheduled_date: date) -> date | None:
         """
         Get the actual collection date accounting for holidays.
 
+        Results are cached until the holiday schedule or collection day changes.
+
+        Args:
+            scheduled_date: The normally scheduled collection date
+
+        Returns:
+            Adjusted date or None if collection is cancelled
+        """
+        # Most weeks have no holidays at all
+        if scheduled_date.isocalendar()[:2] not in self.holiday_parser.affected_weeks:
+            return scheduled_date
+
+        if scheduled_date in self._adjustment_cache:
+            return self._adjustment_cache[scheduled_date]
+
+        adjusted = self._calculate_adjusted_collection_date(scheduled_date)
+        self._adjustment_cache[scheduled_date] = adjusted
+        return adjusted
+
+    def _calculate_adjusted_collection_date(
+        self, scheduled_date: date
+    ) -> date | None:
+        """
+        Calculate the actual collection date accounting for holidays.
+
         This checks if there's a holiday during the week that affects this collection day.
 
         Args:
@@ -155,8 +288,8 @@ class DelawareRefuseCoordinator(DataUpdateCoordinator):
             Adjusted date or None if collection is cancelled
         """
         # Check if the scheduled date itself is a holiday
-        if scheduled_date in self.holiday_parser.holidays:
-            holiday_info = self.holiday_parser.holidays[scheduled_date]
+        holiday_info = self.holiday_parser.holidays.get(scheduled_date)
+        if holiday_info is not None:
             adjustment = holiday_info.get("adjustment", {})
             adj_type = adjustment.get("type")
 
@@ -193,53 +326,44 @@ class DelawareRefuseCoordinator(DataUpdateCoordinator):
         # For "shift_one_day" holidays, all days after the holiday shift forward
         week_start = scheduled_date - timedelta(days=scheduled_date.weekday())
 
-        for day_offset in range(scheduled_date.weekday()):
-            check_date = week_start + timedelta(days=day_offset)
-            if check_date in self.holiday_parser.holidays:
-                holiday_info = self.holiday_parser.holidays[check_date]
-                adjustment = holiday_info.get("adjustment", {})
-                adj_type = adjustment.get("type")
-
-                if adj_type == "shift_one_day":
-                    # This holiday shifts the entire week
-                    _LOGGER.debug(
-                        "Holiday %s on %s shifts collection from %s to %s",
-                        holiday_info.get("name"), check_date,
-                        scheduled_date, scheduled_date + timedelta(days=1)
-                    )
-                    return scheduled_date + timedelta(days=1)
-
-                elif adj_type == "specific_reschedule":
-                    # Check if this holiday affects our collection day
-                    reschedules = adjustment.get("reschedules", [])
-                    for reschedule in reschedules:
-                        # If a day before us is rescheduled to our day, we need to move
-                        if reschedule["to"] == self.collection_day:
-                            _LOGGER.debug(
-                                "Holiday %s reschedules %s to %s, pushing %s forward",
-                                holiday_info.get("name"), reschedule["from"],
-                                reschedule["to"], scheduled_date
-                            )
-                            return scheduled_date + timedelta(days=1)
+        for holiday_info in self.holiday_parser.get_holidays_between(
+            week_start, scheduled_date
+        ):
+            check_date = holiday_info["date"]
+            adjustment = holiday_info.get("adjustment", {})
+            adj_type = adjustment.get("type")
+
+            if adj_type == "shift_one_day":
+                # This holiday shifts the entire week
+                _LOGGER.debug(
+                    "Holiday %s on %s shifts collection from %s to %s",
+                    holiday_info.get("name"), check_date,
+                    scheduled_date, scheduled_date + timedelta(days=1)
+                )
+                return scheduled_date + timedelta(days=1)
+
+            elif adj_type == "specific_reschedule":
+                # Check if this holiday affects our collection day
+                reschedules = adjustment.get("reschedules", [])
+                for reschedule in reschedules:
+                    # If a day before us is rescheduled to our day, we need to move
+                    if reschedule["to"] == self.collection_day:
+                        _LOGGER.debug(
+                            "Holiday %s reschedules %s to %s, pushing %s forward",
+                            holiday_info.get("name"), reschedule["from"],
+                            reschedule["to"], scheduled_date
+                        )
+                        return scheduled_date + timedelta(days=1)
 
         return scheduled_date
 
     def _get_day_offset(self, from_day: str, to_day: str) -> int:
         """Calculate days between two weekday names."""
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        try:
-            from_idx = days.index(from_day)
-            to_idx = days.index(to_day)
-            offset = to_idx - from_idx
-            if offset <= 0:
-                offset += 7
-            return offset
-        except ValueError:
-            return 0
+        return DAY_OFFSET.get((from_day, to_day), 0)
 
     def get_events(
         self, start_date: datetime, end_date: datetime
-    ) -> list[dict[str, Any]]:
+    ) -> list[RefuseEvent]:
         """
         Get events within a date range.
 
@@ -250,30 +374,16 @@ class DelawareRefuseCoordinator(DataUpdateCoordinator):
         Returns:
             List of events within the range
         """
-        if not self.data or "events" not in self.data:
+        if not self.data:
             return []
 
-        events = []
-        for event in self.data["events"]:
-            event_date = event["start"]
-
-            # Convert date to timezone-aware datetime for comparison
-            if isinstance(event_date, date) and not isinstance(event_date, datetime):
-                event_date = datetime.combine(event_date, datetime.min.time())
-                event_date = dt_util.as_local(event_date)
-            elif isinstance(event_date, datetime) and event_date.tzinfo is None:
-                event_date = dt_util.as_local(event_date)
-
-            # Ensure comparison dates are timezone-aware
-            start_compare = start_date
-            end_compare = end_date
+        start_local = dt_util.as_local(start_date)
+        end_local = dt_util.as_local(end_date)
 
-            if start_compare.tzinfo is None:
-                start_compare = dt_util.as_local(start_compare)
-            if end_compare.tzinfo is None:
-                end_compare = dt_util.as_local(end_compare)
+        # Events start at local midnight, so only days whose midnight lies
+        # within the range are included
+        start_day = start_local.date()
+        if start_local.time() != datetime.min.time():
+            start_day += timedelta(days=1)
 
-            if start_compare <= event_date <= end_compare:
-                events.append(event)
-
-        return events
+        return self._generate_events_in_range(start_day, end_local.date())
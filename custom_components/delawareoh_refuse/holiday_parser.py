@@ -1,36 +1,100 @@
 """Holiday parser for Delaware refuse collection schedule adjustments."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import time
+from bisect import bisect_left
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Any
 from io import BytesIO
 
-import requests
-from PyPDF2 import PdfReader
+import aiohttp
+from pypdf import PdfReader
 
-from .const import HOLIDAY_DOCUMENT_URL
+from homeassistant.core import HomeAssistant
+
+from .const import HOLIDAY_DOCUMENT_URL, DAY_TO_IDX, DAY_OFFSET
 
 _LOGGER = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Non-entry lines after the last holiday entry before parsing stops
+_MAX_TRAILING_LINES = 100
+
+_WORK_WEEKDAYS = frozenset(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"])
+
+# Lowercase month name -> month number, matched case-insensitively like %B
+_MONTHS = {
+    name: idx
+    for idx, name in enumerate([
+        "january", "february", "march", "april", "may", "june",
+        "july", "august", "september", "october", "november", "december",
+    ], start=1)
+}
+
+# First letters of the weekday names; other lines cannot start an entry
+_WEEKDAY_FIRST = frozenset("MTWFS")
+
+# Holiday entry header, e.g. "Monday, January 20   Martin Luther King, Jr. Day"
+_DATE_LINE_RE = re.compile(
+    r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
+    r'(\w+)\s+(\d{1,2})(?:,\s+(\d{4}))?\s+(.+)'
+)
+_WS_RE = re.compile(r'\s+')
+# Adjustment phrases matched against the normalized text, in one pass; the
+# group name identifies the phrase. "No Delay" and "accelerated schedule" are
+# checked on the raw text instead, so a line break inside them is not a match.
+# "take place" might be split as "take pl ace" in PDF extraction.
+# "Collections will NOT occur on <Day>" also captures the skipped day.
+_ADJUSTMENT_RE = re.compile(
+    r'(?P<delay>(?i:delayed\s+one\s+day))'
+    r'|(?P<reschedule>(?i:collections will (?:take pl?\s*ace|occur) on))'
+    r'|(?P<not_occur>(?P<no_collection>Collections )?will NOT occur'
+    r'(?: on (?P<no_collection_day>Monday|Tuesday|Wednesday|Thursday|Friday))?)'
+)
+_RESCHEDULE_RE = re.compile(
+    r'(Monday|Tuesday|Wednesday|Thursday|Friday) collections will '
+    r'(?:take pl?\s*ace|occur) on (Monday|Tuesday|Wednesday|Thursday|Friday)'
+)
+_DAY_CHANGE_RE = re.compile(
+    r'(Monday|Tuesday|Wednesday|Thursday|Friday).*?(to|delayed to|pickup on)\s+'
+    r'(Monday|Tuesday|Wednesday|Thursday|Friday)',
+    re.IGNORECASE
+)
+
 
 class HolidayParser:
     """Parser for Delaware refuse collection holiday schedules."""
 
-    def __init__(self):
+    def __init__(self, hass: HomeAssistant, session: aiohttp.ClientSession) -> None:
         """Initialize the holiday parser."""
-        self.holidays: Dict[date, Dict[str, Any]] = {}
-
-    def fetch_holiday_schedule(self) -> bytes:
+        self.hass = hass
+        self.session = session
+        self.holidays: dict[date, dict[str, Any]] = {}
+        self.affected_weeks: frozenset[tuple[int, int]] = frozenset()
+        # Holiday dates in ascending order, with their entries at the same index
+        self._sorted_dates: list[date] = []
+        self._sorted_infos: list[dict[str, Any]] = []
+        self.last_update_ts: float = 0.0
+        # Validators from the last download, for conditional requests
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        # Digest of the last parsed PDF, to skip re-parsing identical content
+        self._last_pdf_hash: bytes | None = None
+
+    async def fetch_holiday_schedule(self) -> bytes | None:
         """
         Fetch the holiday schedule document.
 
         Returns:
-            PDF content as bytes
+            PDF content as bytes, or None if unchanged since the last download
 
         Raises:
-            requests.RequestException: If download fails
+            aiohttp.ClientError: If download fails
         """
         _LOGGER.debug("Fetching holiday schedule from %s", HOLIDAY_DOCUMENT_URL)
 
@@ -40,12 +104,29 @@ class HolidayParser:
             "Referer": "https://www.delawareohio.net"
         }
 
-        response = requests.get(HOLIDAY_DOCUMENT_URL, headers=headers, timeout=30)
-        response.raise_for_status()
+        # Only ask for changes if we have a parsed schedule to fall back on
+        if self.holidays:
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+        async with self.session.get(
+            HOLIDAY_DOCUMENT_URL, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
+            if response.status == 304:
+                _LOGGER.debug("Holiday schedule not modified since last download")
+                return None
+
+            response.raise_for_status()
+            content = await response.read()
 
-        return response.content
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
 
-    def parse_pdf(self, pdf_content: bytes) -> List[Dict[str, Any]]:
+            return content
+
+    def parse_pdf(self, pdf_content: bytes) -> list[dict[str, Any]]:
         """
         Parse the PDF document and extract holiday information.
 
@@ -57,15 +138,13 @@ class HolidayParser:
         """
         _LOGGER.debug("Parsing PDF content")
 
-        holidays = []
+        holidays: list[dict[str, Any]] = []
 
         try:
             pdf_file = BytesIO(pdf_content)
             pdf_reader = PdfReader(pdf_file)
 
-            full_text = ""
-            for page in pdf_reader.pages:
-                full_text += page.extract_text()
+            full_text = "".join(page.extract_text() for page in pdf_reader.pages)
 
             _LOGGER.debug("Extracted text length: %d characters", len(full_text))
 
@@ -74,8 +153,10 @@ class HolidayParser:
             # Example: "Monday, January 20   Martin Luther King, Jr. Day"
             lines = full_text.split('\n')
 
-            current_holiday = None
-            current_text = []
+            current_holiday: dict[str, Any] | None = None
+            current_text: list[str] = []
+            seen_holiday = False
+            lines_since_holiday = 0
 
             for line in lines:
                 line = line.strip()
@@ -84,13 +165,14 @@ class HolidayParser:
 
                 # Check if this line starts a new holiday entry
                 # Format: "Day, Month Date   Holiday Name"
-                date_match = re.match(
-                    r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
-                    r'(\w+)\s+(\d{1,2})(?:,\s+(\d{4}))?\s+(.+)',
-                    line
+                date_match = (
+                    _DATE_LINE_RE.match(line) if line[0] in _WEEKDAY_FIRST else None
                 )
 
                 if date_match:
+                    seen_holiday = True
+                    lines_since_holiday = 0
+
                     # Save previous holiday if exists
                     if current_holiday and current_text:
                         holiday_info = self._parse_holiday_entry(
@@ -108,9 +190,7 @@ class HolidayParser:
 
                     # Parse the date
                     try:
-                        holiday_date = datetime.strptime(
-                            f"{month_name} {day}, {year}", "%B %d, %Y"
-                        ).date()
+                        holiday_date = date(year, _MONTHS[month_name.lower()], day)
 
                         current_holiday = {
                             "name": holiday_name,
@@ -118,10 +198,16 @@ class HolidayParser:
                             "day_of_week": day_of_week
                         }
                         current_text = []
-                    except ValueError:
+                    except (KeyError, ValueError):
                         _LOGGER.warning("Could not parse date: %s %d, %d", month_name, day, year)
                         current_holiday = None
                 else:
+                    # Anything this far past the last entry is trailing
+                    # matter (footers, appendices), not part of the table
+                    lines_since_holiday += 1
+                    if seen_holiday and lines_since_holiday > _MAX_TRAILING_LINES:
+                        break
+
                     # Add to current holiday's text
                     if current_holiday:
                         current_text.append(line)
@@ -143,8 +229,8 @@ class HolidayParser:
         return holidays
 
     def _parse_holiday_entry(
-        self, holiday: Dict[str, Any], text: str
-    ) -> Dict[str, Any] | None:
+        self, holiday: dict[str, Any], text: str
+    ) -> dict[str, Any] | None:
         """
         Parse a single holiday entry's text to extract adjustment information.
 
@@ -155,76 +241,64 @@ class HolidayParser:
         Returns:
             Complete holiday dictionary with adjustment info
         """
-        adjustment = {}
-
-        # Normalize whitespace for better matching (PDF extraction can have extra spaces)
-        normalized_text = re.sub(r'\s+', ' ', text)
-
         # Pattern 1: "No Collection Delays this week"
+        # Most weeks have no delays; decide those without normalizing the text
         if "No Collection Delays" in text or "No Delay" in text:
-            adjustment["type"] = "none"
+            holiday["adjustment"] = {"type": "none"}
+            holiday["description"] = text
+            return holiday
+
+        adjustment: dict[str, Any] = {}
+
+        # Normalize whitespace for better matching (PDF extraction can have extra spaces)
+        normalized_text = _WS_RE.sub(' ', text)
+
+        # Scan once for the remaining adjustment phrases, then apply them in
+        # order of precedence below
+        found = set()
+        no_collection_day = None
+        for match in _ADJUSTMENT_RE.finditer(normalized_text):
+            found.add(match.lastgroup)
+            if no_collection_day is None and match["no_collection"]:
+                no_collection_day = match["no_collection_day"]
+
+        # Both rescheduling branches below need the same day pairs; collect
+        # them once, and only when one of those branches can be taken
+        reschedules: list[dict[str, str]] = []
+        if "reschedule" in found or "not_occur" in found:
+            reschedules = [
+                {"from": from_day, "to": to_day}
+                for from_day, to_day in _RESCHEDULE_RE.findall(normalized_text)
+            ]
 
         # Pattern 2: "Collections will be delayed one day this week"
-        elif re.search(r'delayed\s+one\s+day', normalized_text, re.IGNORECASE):
+        if "delay" in found:
             adjustment["type"] = "shift_one_day"
-            # Find which day has no collection
-            no_collection_match = re.search(
-                r'Collections will NOT\s+occur on (Monday|Tuesday|Wednesday|Thursday|Friday)',
-                normalized_text
-            )
-            if no_collection_match:
-                adjustment["no_collection_day"] = no_collection_match.group(1)
+            # Which day has no collection, if the entry says
+            if no_collection_day:
+                adjustment["no_collection_day"] = no_collection_day
 
         # Pattern 3: Specific day rescheduling
         # "Monday collections will take place on Tuesday"
-        # Note: "take place" might be split as "take pl ace" in PDF extraction
-        elif re.search(r'collections will (?:take pl?\s*ace|occur) on', normalized_text, re.IGNORECASE):
+        elif "reschedule" in found:
             adjustment["type"] = "specific_reschedule"
-            adjustment["reschedules"] = []
-
-            # Find all reschedule patterns
-            reschedule_matches = re.finditer(
-                r'(Monday|Tuesday|Wednesday|Thursday|Friday) collections will (?:take pl?\s*ace|occur) on (Monday|Tuesday|Wednesday|Thursday|Friday)',
-                normalized_text
-            )
-
-            for match in reschedule_matches:
-                from_day = match.group(1)
-                to_day = match.group(2)
-                adjustment["reschedules"].append({
-                    "from": from_day,
-                    "to": to_day
-                })
+            adjustment["reschedules"] = reschedules
 
         # Pattern 4: Accelerated schedule (earlier pickup but same day)
         elif "accelerated schedule" in text:
             adjustment["type"] = "accelerated"
 
         # Default: if we see "Collections will NOT occur" but no delay, assume it's rescheduled
-        elif "will NOT occur" in normalized_text:
+        elif "not_occur" in found:
             adjustment["type"] = "specific_reschedule"
-            adjustment["reschedules"] = []
-
-            # Try to find the reschedule info
-            reschedule_matches = re.finditer(
-                r'(Monday|Tuesday|Wednesday|Thursday|Friday) collections will (?:take pl?\s*ace|occur) on (Monday|Tuesday|Wednesday|Thursday|Friday)',
-                normalized_text
-            )
-
-            for match in reschedule_matches:
-                from_day = match.group(1)
-                to_day = match.group(2)
-                adjustment["reschedules"].append({
-                    "from": from_day,
-                    "to": to_day
-                })
+            adjustment["reschedules"] = reschedules
 
         holiday["adjustment"] = adjustment
         holiday["description"] = text
 
         return holiday
 
-    def _parse_adjustment(self, text: str) -> Dict[str, str]:
+    def _parse_adjustment(self, text: str) -> dict[str, str]:
         """
         Parse the schedule adjustment from text.
 
@@ -238,15 +312,14 @@ class HolidayParser:
         # Example: "Monday collection moves to Tuesday" ->
         # {"Monday": "Tuesday"}
 
-        adjustment = {}
+        adjustment: dict[str, str] = {}
 
         # Common patterns:
         # "Monday to Tuesday"
         # "Monday collection delayed to Tuesday"
         # "No collection on Monday, pickup on Tuesday"
 
-        pattern = r'(Monday|Tuesday|Wednesday|Thursday|Friday).*?(to|delayed to|pickup on)\s+(Monday|Tuesday|Wednesday|Thursday|Friday)'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _DAY_CHANGE_RE.search(text)
 
         if match:
             original_day = match.group(1).capitalize()
@@ -268,10 +341,11 @@ class HolidayParser:
             otherwise original_date
         """
         # Check if this date is a holiday
-        if original_date not in self.holidays:
+        idx = bisect_left(self._sorted_dates, original_date)
+        if idx == len(self._sorted_dates) or self._sorted_dates[idx] != original_date:
             return original_date
+        holiday_info = self._sorted_infos[idx]
 
-        holiday_info = self.holidays[original_date]
         adjustment = holiday_info.get("adjustment", {})
         adj_type = adjustment.get("type")
 
@@ -280,6 +354,42 @@ class HolidayParser:
             collection_day, original_date, holiday_info.get("name"), adj_type
         )
 
+        return self._compute_adjusted(
+            adj_type,
+            adjustment.get("no_collection_day"),
+            tuple(
+                (reschedule["from"], reschedule["to"])
+                for reschedule in adjustment.get("reschedules", [])
+            ),
+            original_date,
+            collection_day,
+        )
+
+    def get_holidays_between(self, start: date, end: date) -> list[dict[str, Any]]:
+        """
+        Get the holidays from start up to, but not including, end.
+
+        Args:
+            start: First date of the range
+            end: Date after the last date of the range
+
+        Returns:
+            Holiday dictionaries in date order
+        """
+        lo = bisect_left(self._sorted_dates, start)
+        hi = bisect_left(self._sorted_dates, end, lo)
+        return self._sorted_infos[lo:hi]
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _compute_adjusted(
+        adj_type: str | None,
+        no_collection_day: str | None,
+        reschedules: tuple[tuple[str, str], ...],
+        original_date: date,
+        collection_day: str,
+    ) -> date:
+        """Apply a holiday adjustment to a single collection date."""
         # No adjustment needed
         if adj_type == "none":
             return original_date
@@ -290,25 +400,20 @@ class HolidayParser:
 
         # Shift entire week by one day
         if adj_type == "shift_one_day":
-            no_collection_day = adjustment.get("no_collection_day")
             # If the holiday falls on the collection day, shift forward by 1
             if collection_day == no_collection_day:
                 return original_date + timedelta(days=1)
             # If collection day is after the holiday in the week, also shift
-            week_days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-            if (no_collection_day in week_days and collection_day in week_days and
-                week_days.index(collection_day) > week_days.index(no_collection_day)):
+            if (no_collection_day in _WORK_WEEKDAYS and collection_day in _WORK_WEEKDAYS and
+                DAY_TO_IDX[collection_day] > DAY_TO_IDX[no_collection_day]):
                 return original_date + timedelta(days=1)
             return original_date
 
         # Specific day rescheduling
         if adj_type == "specific_reschedule":
-            reschedules = adjustment.get("reschedules", [])
-
-            for reschedule in reschedules:
-                if collection_day == reschedule["from"]:
-                    to_day = reschedule["to"]
-                    days_offset = self._get_day_offset(collection_day, to_day)
+            for from_day, to_day in reschedules:
+                if collection_day == from_day:
+                    days_offset = HolidayParser._get_day_offset(collection_day, to_day)
                     return original_date + timedelta(days=days_offset)
 
             return original_date
@@ -316,7 +421,8 @@ class HolidayParser:
         # Unknown adjustment type - return original date
         return original_date
 
-    def _get_day_offset(self, from_day: str, to_day: str) -> int:
+    @staticmethod
+    def _get_day_offset(from_day: str, to_day: str) -> int:
         """
         Calculate the offset in days between two weekday names.
 
@@ -327,32 +433,81 @@ class HolidayParser:
         Returns:
             Number of days to add
         """
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-        try:
-            from_idx = days.index(from_day)
-            to_idx = days.index(to_day)
-
-            offset = to_idx - from_idx
-            if offset <= 0:
-                offset += 7
-
-            return offset
-        except ValueError:
+        offset = DAY_OFFSET.get((from_day, to_day))
+        if offset is None:
             _LOGGER.error("Invalid day name: %s or %s", from_day, to_day)
             return 0
 
-    def update(self) -> None:
+        return offset
+
+    async def update(self) -> None:
         """Fetch and update the holiday schedule."""
         try:
-            pdf_content = self.fetch_holiday_schedule()
-            holidays_list = self.parse_pdf(pdf_content)
+            pdf_content = await self.fetch_holiday_schedule()
+
+            if pdf_content is None:
+                # Server confirmed the current schedule is still valid
+                self.last_update_ts = time.time()
+                return
+
+            pdf_hash = hashlib.blake2b(pdf_content, digest_size=16).digest()
+            if pdf_hash == self._last_pdf_hash and self.holidays:
+                _LOGGER.debug("Holiday schedule content unchanged, skipping parse")
+                self.last_update_ts = time.time()
+                return
+
+            # PDF parsing is CPU bound, keep it off the event loop
+            holidays_list = await self.hass.async_add_executor_job(
+                self.parse_pdf, pdf_content
+            )
 
             # Convert list to dictionary indexed by date
-            self.holidays = {h["date"]: h for h in holidays_list}
+            self._set_holidays(holidays_list)
+            self.last_update_ts = time.time()
+            self._last_pdf_hash = pdf_hash
 
             _LOGGER.info("Updated holiday schedule with %d holidays", len(self.holidays))
 
         except Exception as err:
             _LOGGER.error("Failed to update holiday schedule: %s", err)
+            # Download in full next time rather than trusting a 304
+            self.etag = None
+            self.last_modified = None
             # Don't raise - use cached holidays if update fails
+
+    def _set_holidays(self, holidays_list: list[dict[str, Any]]) -> None:
+        """Replace the holiday schedule with the given holiday entries."""
+        self.holidays = {h["date"]: h for h in holidays_list}
+        self._sorted_dates = sorted(self.holidays)
+        self._sorted_infos = [self.holidays[d] for d in self._sorted_dates]
+        # ISO (year, week) pairs containing at least one holiday
+        self.affected_weeks = frozenset(d.isocalendar()[:2] for d in self.holidays)
+        # Adjustments computed against the previous schedule are not needed again
+        self._compute_adjusted.cache_clear()
+
+    def to_storage(self) -> dict[str, Any]:
+        """Return the parsed schedule in a JSON-serializable form."""
+        return {
+            "last_update_ts": self.last_update_ts,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "pdf_hash": self._last_pdf_hash.hex() if self._last_pdf_hash else None,
+            "holidays": [
+                {**holiday, "date": holiday["date"].isoformat()}
+                for holiday in self.holidays.values()
+            ],
+        }
+
+    def load_storage(self, data: dict[str, Any]) -> None:
+        """Restore a schedule previously returned by to_storage."""
+        self._set_holidays([
+            {**holiday, "date": date.fromisoformat(holiday["date"])}
+            for holiday in data.get("holidays", [])
+        ])
+        self.last_update_ts = data.get("last_update_ts", 0.0)
+        self.etag = data.get("etag")
+        self.last_modified = data.get("last_modified")
+        pdf_hash = data.get("pdf_hash")
+        self._last_pdf_hash = bytes.fromhex(pdf_hash) if pdf_hash else None
+
+        _LOGGER.debug("Loaded %d cached holidays", len(self.holidays))